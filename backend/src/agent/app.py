@@ -1,22 +1,40 @@
 # mypy: disable - error - code = "no-untyped-def,misc"
+import hashlib
+import os
 import pathlib
 import time
+from enum import Enum
 import asyncio
-import json
 from typing import Dict, Any, Optional, AsyncGenerator
+import orjson
+from cachetools import TTLCache
+
+# Install uvloop's libuv-backed event loop before the app is created. The
+# SSE + agent-handoff workload is dominated by many small awaits, where
+# uvloop roughly halves per-await overhead. Optional: unavailable on Windows.
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
 from fastapi import FastAPI, Response, HTTPException
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import StreamingResponse
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from langchain_core.messages import HumanMessage
 
-from src.agent.graph import graph
+from src.agent.graph import _run_blocking, graph, render_analysis
+from src.agent.semantic_cache import create_semantic_cache
 from src.agent.state import OverallState, QueryType, DebateCategory, AgentType, SupervisorDecision
 
 
-# Define request/response models
+# Define request/response models. Validation runs on every request, so keep
+# it on pydantic v2's rust-core fast path: drop unknown fields instead of
+# collecting them and skip revalidation on attribute writes.
 class ProductRequirementsRequest(BaseModel):
+    model_config = ConfigDict(extra="ignore", validate_assignment=False)
+
     query: str
     query_type: Optional[str] = None
     debate_content: Optional[str] = None
@@ -24,7 +42,10 @@ class ProductRequirementsRequest(BaseModel):
 
 
 class ProductRequirementsResponse(BaseModel):
+    model_config = ConfigDict(extra="ignore", validate_assignment=False)
+
     answer: str
+    from_cache: bool = False
     processing_time: float
     query_type: str
     debate_category: Optional[str] = None
@@ -41,16 +62,24 @@ class ProductRequirementsResponse(BaseModel):
 app = FastAPI(
     title="Supervisor-Based Multi-Agent Product Requirements Refinement System",
     description="A sophisticated supervisor-based multi-agent AI system for refining product requirements with dynamic routing and debate handling capabilities",
-    version="2.0.0"
+    version="2.0.0",
+    # Serialize all JSON responses with orjson instead of the default
+    # json.dumps + jsonable_encoder walk; responses carrying agent_history
+    # lists and long analysis strings benefit the most
+    default_response_class=ORJSONResponse,
 )
 
-# Add CORS middleware
+# Add CORS middleware. Only the methods and headers the API actually uses
+# are allowed, and preflight responses are cached browser-side for a day so
+# repeat fetches skip the OPTIONS round-trip. Set FRONTEND_ORIGIN in
+# production to lock the API to the deployed frontend.
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # In production, replace with specific origins
+    allow_origins=[os.environ.get("FRONTEND_ORIGIN", "*")],
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST", "DELETE", "OPTIONS"],
+    allow_headers=["Content-Type"],
+    max_age=86400,
 )
 
 
@@ -81,12 +110,81 @@ def create_frontend_router(build_dir="../frontend/dist"):
 
         return Route("/{path:path}", endpoint=dummy_frontend)
 
-    return StaticFiles(directory=build_path, html=True)
+    # The directory was already verified above; check_dir=False skips
+    # Starlette's redundant stat on the mount path
+    return StaticFiles(directory=build_path, html=True, check_dir=False)
+
 
+@app.middleware("http")
+async def cache_static_assets(request, call_next):
+    """Mark hashed frontend assets as immutable so browsers skip re-fetching.
 
-async def stream_graph_execution(initial_state: OverallState, thread_id: Optional[str] = None) -> AsyncGenerator[str, None]:
+    Vite emits content-hashed filenames under /app/assets, so the bytes for a
+    given URL never change and a year-long immutable cache is safe.
+    """
+    response = await call_next(request)
+    if request.url.path.startswith("/app/assets/"):
+        response.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+    return response
+
+
+# Maps graph node names to the SSE event type and the state key holding the
+# node's output, so each node's completion can be streamed as soon as it lands
+_STREAM_NODE_EVENTS = {
+    "domain_expert": ("domain_expert", "domain_expert_analysis"),
+    "ux_ui_specialist": ("ux_ui_specialist", "ux_ui_specialist_analysis"),
+    "technical_architect": ("technical_architect", "technical_architect_analysis"),
+    "revenue_model_analyst": ("revenue_model_analyst", "revenue_model_analyst_analysis"),
+    "moderator_aggregation": ("moderator_aggregation", "moderator_aggregation"),
+    "finalize_answer": ("final_answer", "final_answer"),
+}
+
+# The parallel fan-out node emits all specialist analyses in a single update
+_PARALLEL_SPECIALIST_EVENTS = [
+    _STREAM_NODE_EVENTS["domain_expert"],
+    _STREAM_NODE_EVENTS["ux_ui_specialist"],
+    _STREAM_NODE_EVENTS["technical_architect"],
+    _STREAM_NODE_EVENTS["revenue_model_analyst"],
+]
+
+# Precomputed SSE frame byte prefixes: only the content still needs
+# serializing per event, and orjson does that at C speed
+_FRAME_PREFIX = {
+    event_type: b'data: {"type":"' + event_type.encode() + b'","content":'
+    for event_type in (
+        "supervisor_decision",
+        "domain_expert",
+        "ux_ui_specialist",
+        "technical_architect",
+        "revenue_model_analyst",
+        "moderator_aggregation",
+        "debate_analysis",
+        "final_answer",
+        "error",
+    )
+}
+_COMPLETE_FRAME = b'data: {"type":"complete"}\n\n'
+
+# Delta frames carry individual LLM tokens for the final answer so the
+# frontend can start rendering words while generation is still running.
+# The type is distinct from "final_answer" so consumers that only handle
+# whole-answer frames ignore deltas instead of misrendering them.
+_DELTA_PREFIX = b'data: {"type":"final_answer_delta","delta":'
+
+
+def _sse_frame(event_type: str, content: Any) -> bytes:
+    """Build a serialized SSE data frame for the given event type."""
+    return _FRAME_PREFIX[event_type] + orjson.dumps(content) + b"}\n\n"
+
+
+def _sse_delta_frame(token: str) -> bytes:
+    """Build a final-answer token delta frame."""
+    return _DELTA_PREFIX + orjson.dumps(token) + b"}\n\n"
+
+
+async def stream_graph_execution(initial_state: OverallState, thread_id: Optional[str] = None) -> AsyncGenerator[bytes, None]:
     """Stream the graph execution with real-time updates for Supervisor-based architecture."""
-    
+
     try:
         # Prepare configuration with thread_id for context
         config = {}
@@ -99,39 +197,179 @@ async def stream_graph_execution(initial_state: OverallState, thread_id: Optiona
                     "enable_parallel_processing": True
                 }
             }
-        
-        # Run the graph and capture results
-        result = await graph.ainvoke(initial_state, config)
-        
-        # Stream supervisor decisions and agent activities
-        agent_history = result.get("agent_history", [])
-        
-        for entry in agent_history:
-            await asyncio.sleep(0.3)  # Simulate processing time
-            
-            if entry.get("agent") == "supervisor":
-                yield f"data: {json.dumps({'type': 'supervisor_decision', 'content': entry.get('reasoning', 'Supervisor analyzing...')})}\n\n"
-            elif entry.get("agent") == "domain_expert":
-                yield f"data: {json.dumps({'type': 'domain_expert', 'content': result.get('domain_expert_analysis', 'Domain analysis completed')})}\n\n"
-            elif entry.get("agent") == "ux_ui_specialist":
-                yield f"data: {json.dumps({'type': 'ux_ui_specialist', 'content': result.get('ux_ui_specialist_analysis', 'UX/UI analysis completed')})}\n\n"
-            elif entry.get("agent") == "technical_architect":
-                yield f"data: {json.dumps({'type': 'technical_architect', 'content': result.get('technical_architect_analysis', 'Technical analysis completed')})}\n\n"
-            elif entry.get("agent") == "revenue_model_analyst":
-                yield f"data: {json.dumps({'type': 'revenue_model_analyst', 'content': result.get('revenue_model_analyst_analysis', 'Revenue analysis completed')})}\n\n"
-            elif entry.get("agent") == "moderator":
-                yield f"data: {json.dumps({'type': 'moderator_aggregation', 'content': result.get('moderator_aggregation', 'Moderator aggregation completed')})}\n\n"
-            elif entry.get("agent") == "debate_analyzer":
-                yield f"data: {json.dumps({'type': 'debate_analysis', 'content': result.get('debate_resolution', 'Debate analysis completed')})}\n\n"
-            elif entry.get("agent") == "finalizer":
-                yield f"data: {json.dumps({'type': 'final_answer', 'content': result.get('final_answer', 'Final answer generated')})}\n\n"
-        
+
+        # Stream individual tokens and per-node updates the moment they are
+        # produced instead of waiting for the whole pipeline to finish.
+        # Token deltas are only emitted for finalize_answer: the specialist
+        # nodes generate structured (function-call) output whose raw tokens
+        # are not renderable.
+        async for event in graph.astream_events(initial_state, config, version="v2"):
+            kind = event["event"]
+
+            if kind == "on_chat_model_stream":
+                if event.get("metadata", {}).get("langgraph_node") == "finalize_answer":
+                    token = event["data"]["chunk"].content
+                    if token:
+                        yield _sse_delta_frame(token)
+                continue
+
+            if kind != "on_chain_end":
+                continue
+            node_name = event.get("name")
+            node_update = event["data"].get("output")
+            if not isinstance(node_update, dict):
+                continue
+
+            if node_name == "supervisor":
+                yield _sse_frame("supervisor_decision", node_update.get("supervisor_reasoning") or "Supervisor analyzing...")
+            elif node_name == "classify_query":
+                # Debate analysis is fused into classification; only debate
+                # queries produce a resolution to surface
+                if node_update.get("debate_resolution"):
+                    yield _sse_frame("debate_analysis", node_update["debate_resolution"])
+            elif node_name == "parallel_specialists":
+                for event_type, state_key in _PARALLEL_SPECIALIST_EVENTS:
+                    if node_update.get(state_key):
+                        yield _sse_frame(event_type, render_analysis(state_key, node_update[state_key]))
+            elif node_name in _STREAM_NODE_EVENTS:
+                event_type, state_key = _STREAM_NODE_EVENTS[node_name]
+                content = render_analysis(state_key, node_update.get(state_key))
+                yield _sse_frame(event_type, content or f"{event_type} completed")
+
         # Send completion signal
-        yield f"data: {json.dumps({'type': 'complete'})}\n\n"
-        
+        yield _COMPLETE_FRAME
+
     except Exception as e:
         print(f"Error in streaming: {str(e)}")
-        yield f"data: {json.dumps({'type': 'error', 'content': str(e)})}\n\n"
+        yield _sse_frame("error", str(e))
+
+
+# Per-request graph state template: compiled once and shallow-copied per
+# request instead of re-interpreting the same 20-field dict literal in each
+# endpoint. Mutable fields are filled in by build_initial_state.
+_INITIAL_STATE_TEMPLATE: Dict[str, Any] = {
+    "messages": None,
+    "user_query": "",
+    "query_type": QueryType.GENERAL,  # Will be determined by classify_query node
+    "classification_confidence": None,
+    "debate_category": None,
+    "domain_expert_analysis": None,
+    "ux_ui_specialist_analysis": None,
+    "technical_architect_analysis": None,
+    "revenue_model_analyst_analysis": None,
+    "moderator_aggregation": None,
+    "debate_resolution": None,
+    "final_answer": None,
+    "processing_time": 0.0,
+    "cag_prefix": None,
+    # Supervisor-related fields
+    "active_agent": None,
+    "supervisor_decision": None,
+    "supervisor_reasoning": None,
+    "agent_history": None,
+    "current_step": 1,
+    "max_steps": 10,
+    "is_complete": False,
+}
+
+
+def build_initial_state(request: "ProductRequirementsRequest") -> OverallState:
+    """Build the initial graph state for a refinement request."""
+    state = _INITIAL_STATE_TEMPLATE.copy()
+    state["messages"] = [HumanMessage(content=request.query)]
+    state["user_query"] = request.query
+    state["agent_history"] = []
+
+    # If debate content is provided, add it to the state
+    if request.debate_content:
+        state["debate_content"] = request.debate_content
+        state["debate_category"] = DebateCategory.MODERATOR
+
+    return state
+
+
+# Upper bound on one full graph execution; a stuck specialist call should
+# free the worker instead of holding the connection open indefinitely
+GRAPH_TIMEOUT_SECONDS = float(os.getenv("GRAPH_TIMEOUT_SECONDS", "120"))
+
+
+class _CircuitBreaker:
+    """Minimal circuit breaker for the agent pipeline.
+
+    Opens after a run of consecutive failures and short-circuits requests
+    until the recovery window has passed; the next success closes it again.
+    Keeps workers from piling up on a downstream that is already failing.
+    """
+
+    def __init__(self, failure_threshold: int = 5, recovery_seconds: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.recovery_seconds = recovery_seconds
+        self._consecutive_failures = 0
+        self._opened_at = 0.0
+
+    @property
+    def open(self) -> bool:
+        if self._consecutive_failures < self.failure_threshold:
+            return False
+        # Half-open after the recovery window: let a trial request through
+        return (time.time() - self._opened_at) < self.recovery_seconds
+
+    def record_success(self) -> None:
+        self._consecutive_failures = 0
+
+    def record_failure(self) -> None:
+        self._consecutive_failures += 1
+        if self._consecutive_failures >= self.failure_threshold:
+            self._opened_at = time.time()
+
+
+_PIPELINE_BREAKER = _CircuitBreaker()
+
+
+# In-memory response cache: repeated identical requests return the cached
+# response in microseconds instead of re-running the full multi-agent graph.
+# Entries expire because keys include thread_id and the supervisor folds in
+# evolving conversation history, so an answer is only valid for a short
+# window within a live thread.
+RESPONSE_CACHE_TTL_SECONDS = int(os.getenv("RESPONSE_CACHE_TTL_SECONDS", "300"))
+_RESPONSE_CACHE: TTLCache = TTLCache(maxsize=1024, ttl=RESPONSE_CACHE_TTL_SECONDS)
+
+
+# Second-level semantic cache: catches paraphrased near-duplicate queries
+# that the exact-match cache misses. None when the optional embedding
+# dependencies (sentence-transformers, faiss) are not installed.
+_SEMANTIC_CACHE = create_semantic_cache()
+
+
+def _request_cache_key(request: "ProductRequirementsRequest") -> bytes:
+    """Build a compact cache key from the request fields that affect the answer."""
+    raw = "|".join((
+        request.query,
+        request.query_type or "",
+        request.debate_content or "",
+        request.thread_id or "",
+    ))
+    return hashlib.blake2b(raw.encode(), digest_size=16).digest()
+
+
+# Default string values resolved once instead of per response
+_DEFAULT_QUERY_TYPE = QueryType.GENERAL.value
+
+
+def _enum_value(value: Any, default: Optional[str] = None) -> Optional[str]:
+    """Return the string value for an enum-or-string state field."""
+    if value is None:
+        return default
+    if isinstance(value, Enum):
+        return value.value
+    return value
+
+
+# In-flight request coalescing: when identical requests arrive while the
+# first one is still executing, they await the same future instead of each
+# running the full graph (the "simultaneous cold miss" the response cache
+# cannot catch)
+_INFLIGHT: Dict[bytes, asyncio.Future] = {}
 
 
 # API Endpoints
@@ -149,38 +387,64 @@ async def refine_product_requirements(request: ProductRequirementsRequest):
     
     The Supervisor dynamically routes queries and handles debate resolution efficiently.
     """
+    # Serve repeated requests straight from the response cache
+    cache_key = _request_cache_key(request)
+    cached_response = _RESPONSE_CACHE.get(cache_key)
+    if cached_response is not None:
+        return cached_response.model_copy(update={"from_cache": True})
+
+    # Fall back to semantic lookup for paraphrased near-duplicates. The
+    # embedding encode is CPU-bound (plus a lazy model load on first use),
+    # so it runs on the blocking pool instead of stalling the event loop.
+    if _SEMANTIC_CACHE is not None and not request.debate_content:
+        similar_response = await _run_blocking(_SEMANTIC_CACHE.get, request.query)
+        if similar_response is not None:
+            return similar_response.model_copy(update={"from_cache": True})
+
+    # Coalesce concurrent identical requests onto the execution already
+    # in flight instead of running the graph once per caller
+    existing = _INFLIGHT.get(cache_key)
+    if existing is not None:
+        return await existing
+
+    future: asyncio.Future = asyncio.get_running_loop().create_future()
+    _INFLIGHT[cache_key] = future
+    try:
+        response = await _execute_refinement(request)
+
+        _RESPONSE_CACHE[cache_key] = response
+        if _SEMANTIC_CACHE is not None and not request.debate_content:
+            await _run_blocking(_SEMANTIC_CACHE.add, request.query, response)
+
+        future.set_result(response)
+        return response
+    except asyncio.CancelledError:
+        # The owner's disconnect must not kill the coalesced duplicates;
+        # hand them a retryable error instead of propagating cancellation
+        if not future.done():
+            future.set_exception(
+                HTTPException(status_code=503, detail="Coalesced request was cancelled, retry shortly")
+            )
+            future.exception()
+        raise
+    except BaseException as e:
+        if not future.done():
+            future.set_exception(e)
+            # Mark the exception as retrieved in case no duplicate awaited it
+            future.exception()
+        raise
+    finally:
+        _INFLIGHT.pop(cache_key, None)
+
+
+async def _execute_refinement(request: ProductRequirementsRequest) -> ProductRequirementsResponse:
+    """Run the multi-agent graph for a request and build the response."""
     try:
         start_time = time.time()
-        
+
         # Prepare the initial state with Supervisor-related fields
-        initial_state: OverallState = {
-            "messages": [HumanMessage(content=request.query)],
-            "user_query": request.query,
-            "query_type": QueryType.GENERAL,  # Will be determined by classify_query node
-            "debate_category": None,
-            "domain_expert_analysis": None,
-            "ux_ui_specialist_analysis": None,
-            "technical_architect_analysis": None,
-            "revenue_model_analyst_analysis": None,
-            "moderator_aggregation": None,
-            "debate_resolution": None,
-            "final_answer": None,
-            "processing_time": 0.0,
-            # Supervisor-related fields
-            "active_agent": None,
-            "supervisor_decision": None,
-            "supervisor_reasoning": None,
-            "agent_history": [],
-            "current_step": 1,
-            "max_steps": 10,
-            "is_complete": False
-        }
-        
-        # If debate content is provided, add it to the state
-        if request.debate_content:
-            initial_state["debate_content"] = request.debate_content
-            initial_state["debate_category"] = DebateCategory.MODERATOR
-        
+        initial_state = build_initial_state(request)
+
         # Prepare configuration with thread_id for context
         config = {}
         if request.thread_id:
@@ -193,35 +457,53 @@ async def refine_product_requirements(request: ProductRequirementsRequest):
                 }
             }
         
-        # Run the graph using async execution
-        result = await graph.ainvoke(initial_state, config)
-        
+        # Fail fast while the downstream pipeline is known to be unhealthy
+        if _PIPELINE_BREAKER.open:
+            raise HTTPException(status_code=503, detail="Agent pipeline temporarily unavailable, retry shortly")
+
+        # Run the graph using async execution with a bounded overall budget
+        try:
+            result = await asyncio.wait_for(
+                graph.ainvoke(initial_state, config), timeout=GRAPH_TIMEOUT_SECONDS
+            )
+        except asyncio.TimeoutError:
+            _PIPELINE_BREAKER.record_failure()
+            raise HTTPException(status_code=504, detail="Agent pipeline timed out")
+        _PIPELINE_BREAKER.record_success()
+
         # Calculate total processing time
         total_time = time.time() - start_time
         
-        # Extract the final answer from messages
-        final_answer = ""
-        if result.get("messages"):
-            for message in result["messages"]:
-                if hasattr(message, 'content'):
-                    final_answer = message.content
-                    break
-        
-        return ProductRequirementsResponse(
-            answer=final_answer or result.get("final_answer", "No answer generated"),
+        # The finalizer writes the answer to state directly; only fall back to
+        # scanning messages (newest first) when it is missing
+        final_answer = result.get("final_answer")
+        if not final_answer:
+            messages = result.get("messages") or []
+            final_answer = next(
+                (message.content for message in reversed(messages) if getattr(message, "content", None)),
+                "",
+            )
+
+        response = ProductRequirementsResponse(
+            answer=final_answer or "No answer generated",
             processing_time=total_time,
-            query_type=result.get("query_type", QueryType.GENERAL).value,
-            debate_category=result.get("debate_category", DebateCategory.MODERATOR).value if result.get("debate_category") else None,
-            domain_analysis=result.get("domain_expert_analysis"),
-            ux_analysis=result.get("ux_ui_specialist_analysis"),
-            technical_analysis=result.get("technical_architect_analysis"),
+            query_type=_enum_value(result.get("query_type"), _DEFAULT_QUERY_TYPE),
+            debate_category=_enum_value(result.get("debate_category")),
+            domain_analysis=render_analysis("domain_expert_analysis", result.get("domain_expert_analysis")),
+            ux_analysis=render_analysis("ux_ui_specialist_analysis", result.get("ux_ui_specialist_analysis")),
+            technical_analysis=render_analysis("technical_architect_analysis", result.get("technical_architect_analysis")),
             moderator_aggregation=result.get("moderator_aggregation"),
             debate_resolution=result.get("debate_resolution"),
             agent_history=result.get("agent_history"),
             supervisor_reasoning=result.get("supervisor_reasoning")
         )
-        
+
+        return response
+
+    except HTTPException:
+        raise
     except Exception as e:
+        _PIPELINE_BREAKER.record_failure()
         raise HTTPException(status_code=500, detail=f"Error processing request: {str(e)}")
 
 
@@ -235,34 +517,8 @@ async def refine_product_requirements_stream(request: ProductRequirementsRequest
     """
     try:
         # Prepare the initial state with Supervisor-related fields
-        initial_state: OverallState = {
-            "messages": [HumanMessage(content=request.query)],
-            "user_query": request.query,
-            "query_type": QueryType.GENERAL,  # Will be determined by classify_query node
-            "debate_category": None,
-            "domain_expert_analysis": None,
-            "ux_ui_specialist_analysis": None,
-            "technical_architect_analysis": None,
-            "revenue_model_analyst_analysis": None,
-            "moderator_aggregation": None,
-            "debate_resolution": None,
-            "final_answer": None,
-            "processing_time": 0.0,
-            # Supervisor-related fields
-            "active_agent": None,
-            "supervisor_decision": None,
-            "supervisor_reasoning": None,
-            "agent_history": [],
-            "current_step": 1,
-            "max_steps": 10,
-            "is_complete": False
-        }
-        
-        # If debate content is provided, add it to the state
-        if request.debate_content:
-            initial_state["debate_content"] = request.debate_content
-            initial_state["debate_category"] = DebateCategory.MODERATOR
-        
+        initial_state = build_initial_state(request)
+
         # Pass thread_id to the streaming function for context
         return StreamingResponse(
             stream_graph_execution(initial_state, request.thread_id),
@@ -281,10 +537,11 @@ async def refine_product_requirements_stream(request: ProductRequirementsRequest
         raise HTTPException(status_code=500, detail=f"Error processing request: {str(e)}")
 
 
-@app.get("/api/health")
-async def health_check():
-    """Health check endpoint for the supervisor-based multi-agent system."""
-    return {
+# The health and agents payloads are static, so they are serialized once at
+# import time and served as raw responses: no per-request dict construction
+# or JSON-encoder traversal
+_HEALTH_JSON = orjson.dumps(
+    {
         "status": "healthy",
         "system": "Supervisor-Based Multi-Agent Product Requirements Refinement System",
         "version": "2.0.0",
@@ -292,19 +549,17 @@ async def health_check():
         "agents": [
             "Supervisor (Orchestrator)",
             "Domain Expert",
-            "UX/UI Specialist", 
+            "UX/UI Specialist",
             "Technical Architect",
             "Revenue Model Analyst",
             "Moderator/Aggregator",
             "Debate Handler"
         ]
     }
+)
 
-
-@app.get("/api/agents")
-async def get_agents_info():
-    """Get information about available specialist agents and the Supervisor."""
-    return {
+_AGENTS_JSON = orjson.dumps(
+    {
         "agents": {
             "supervisor": {
                 "name": "Supervisor (Orchestrator)",
@@ -343,6 +598,19 @@ async def get_agents_info():
             }
         }
     }
+)
+
+
+@app.get("/api/health")
+async def health_check():
+    """Health check endpoint for the supervisor-based multi-agent system."""
+    return Response(content=_HEALTH_JSON, media_type="application/json")
+
+
+@app.get("/api/agents")
+async def get_agents_info():
+    """Get information about available specialist agents and the Supervisor."""
+    return Response(content=_AGENTS_JSON, media_type="application/json")
 
 
 @app.get("/api/conversation-history/{thread_id}")
@@ -22,6 +22,13 @@ class Configuration(BaseModel):
         },
     )
 
+    per_node_timeout_s: float = Field(
+        default=45.0,
+        metadata={
+            "description": "Maximum time in seconds for a single specialist's LLM call before it is abandoned."
+        },
+    )
+
     enable_parallel_processing: bool = Field(
         default=True,
         metadata={
@@ -1,7 +1,15 @@
+import functools
+import hashlib
+import json
 import os
+import pathlib
+import re
 import time
 import asyncio
-from typing import List, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Tuple
+
+from cachetools import LRUCache
 
 from src.agent.tools_and_schemas import (
     QueryClassification,
@@ -10,17 +18,15 @@ from src.agent.tools_and_schemas import (
     TechnicalArchitectAnalysis,
     RevenueModelAnalystAnalysis,
     ModeratorAggregation,
-    DebateAnalysis,
     SupervisorAnalysis,
     QueryType,
     DebateCategory,
 )
 from dotenv import load_dotenv
-from langchain_core.messages import AIMessage
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
 from langgraph.graph import StateGraph
 from langgraph.graph import START, END
 from langchain_core.runnables import RunnableConfig
-from google.genai import Client
 
 from src.agent.state import (
     OverallState,
@@ -37,33 +43,304 @@ from src.agent.state import (
 from src.agent.configuration import Configuration
 from src.agent.prompts import (
     get_current_date,
-    supervisor_instructions,
-    query_classification_instructions,
-    domain_expert_instructions,
-    ux_ui_specialist_instructions,
-    technical_architect_instructions,
-    revenue_model_analyst_instructions,
-    moderator_aggregation_instructions,
-    debate_analysis_instructions,
-    final_answer_instructions,
+    supervisor_system_instructions,
+    supervisor_query_instructions,
+    query_classification_system_instructions,
+    query_classification_query_instructions,
+    domain_expert_system_instructions,
+    domain_expert_query_instructions,
+    ux_ui_specialist_system_instructions,
+    ux_ui_specialist_query_instructions,
+    technical_architect_system_instructions,
+    technical_architect_query_instructions,
+    revenue_model_analyst_system_instructions,
+    revenue_model_analyst_query_instructions,
+    moderator_aggregation_system_instructions,
+    moderator_aggregation_query_instructions,
+    final_answer_system_instructions,
+    final_answer_query_instructions,
+)
+from src.agent.llm_clients import (
+    bounded_ainvoke,
+    cached_ainvoke,
+    cached_astream_text,
+    get_llm,
+    get_structured_llm,
 )
-from langchain_google_genai import ChatGoogleGenerativeAI
 from src.agent.memory import create_memory_manager, create_mongodb_checkpoint_saver
+from src.agent.semantic_cache import create_semantic_cache
 
 load_dotenv()
 
-# Lazy initialization of genai_client to avoid blocking operations
-_genai_client = None
+# Cache Augmented Generation: precomputed analysis fragments for recurring
+# domains (e-commerce, fintech, ...). Injecting the cached boilerplate into
+# the Domain Expert prompt lets the LLM focus on the query-specific part
+# instead of regenerating the same industry-standards text every request.
+_CAG_FRAGMENTS_PATH = pathlib.Path(__file__).parent.parent.parent / "data" / "cag_fragments.json"
+
+def _load_cag_fragments() -> Dict[str, str]:
+    """Load the precomputed domain analysis fragments from disk."""
+    try:
+        with open(_CAG_FRAGMENTS_PATH, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError) as e:
+        print(f"Warning: Could not load CAG fragments: {e}")
+        return {}
+
+_CAG_FRAGMENTS = _load_cag_fragments()
+
+# Lightweight keyword patterns for tagging a query with a known domain
+_CAG_DOMAIN_PATTERNS = [
+    ("e_commerce", re.compile(r"\b(e-?commerce|shop|store|cart|checkout|marketplace|order|retail)\b", re.IGNORECASE)),
+    ("fintech", re.compile(r"\b(fintech|bank|payment|wallet|loan|lending|trading|invoice|financ\w*)\b", re.IGNORECASE)),
+    ("healthcare", re.compile(r"\b(health|medical|patient|clinic|hospital|telemedicine|pharma\w*)\b", re.IGNORECASE)),
+    ("education", re.compile(r"\b(education|learning|course|student|teacher|school|university|lms)\b", re.IGNORECASE)),
+    ("saas", re.compile(r"\b(saas|subscription|multi-?tenant|b2b platform)\b", re.IGNORECASE)),
+]
+
+def _detect_cag_domain(user_query: str) -> str:
+    """Return the cached analysis fragment for the query's domain, if any."""
+    for domain, pattern in _CAG_DOMAIN_PATTERNS:
+        if pattern.search(user_query):
+            return _CAG_FRAGMENTS.get(domain, "")
+    return ""
+
+
+# Static prompt prefixes materialized once at import: the SystemMessage
+# objects never change, so rebuilding them per node call only re-validates
+# the same content. The structured-output schemas are likewise compiled once
+# via the cached wrappers in llm_clients.
+_SUPERVISOR_SYSTEM_MESSAGE = SystemMessage(content=supervisor_system_instructions)
+_CLASSIFY_SYSTEM_MESSAGE = SystemMessage(content=query_classification_system_instructions)
+_DOMAIN_EXPERT_SYSTEM_MESSAGE = SystemMessage(content=domain_expert_system_instructions)
+_UX_UI_SYSTEM_MESSAGE = SystemMessage(content=ux_ui_specialist_system_instructions)
+_TECHNICAL_SYSTEM_MESSAGE = SystemMessage(content=technical_architect_system_instructions)
+_REVENUE_SYSTEM_MESSAGE = SystemMessage(content=revenue_model_analyst_system_instructions)
+_MODERATOR_SYSTEM_MESSAGE = SystemMessage(content=moderator_aggregation_system_instructions)
+_FINAL_ANSWER_SYSTEM_MESSAGE = SystemMessage(content=final_answer_system_instructions)
+
+
+def _bullets(items: List[str]) -> str:
+    """Render a list of items as newline-separated markdown bullets."""
+    return "\n".join(map("- {}".format, items))
+
+
+# Specialist results are stored in state as structured dicts (model_dump of
+# the schema) and rendered to markdown only at the edges that need text:
+# downstream prompts, SSE frames and the HTTP response. This keeps checkpoint
+# and memory payloads small and defers string building until it is needed.
+
+def _render_domain_expert(data: Dict[str, Any]) -> str:
+    return (
+        f"Domain Analysis: {data['domain_analysis']}\n\n"
+        f"Domain Requirements:\n{_bullets(data['domain_requirements'])}\n\n"
+        f"Domain Concerns:\n{_bullets(data['domain_concerns'])}\n\n"
+        f"Priority Level: {data['priority_level']}"
+    )
+
+
+def _render_ux_ui(data: Dict[str, Any]) -> str:
+    return (
+        f"UX Analysis: {data['ux_analysis']}\n\n"
+        f"UI Requirements:\n{_bullets(data['ui_requirements'])}\n\n"
+        f"User Experience Concerns:\n{_bullets(data['user_experience_concerns'])}\n\n"
+        f"Accessibility Requirements:\n{_bullets(data['accessibility_requirements'])}"
+    )
+
+
+def _render_technical(data: Dict[str, Any]) -> str:
+    return (
+        f"Technical Analysis: {data['technical_analysis']}\n\n"
+        f"Technical Requirements:\n{_bullets(data['technical_requirements'])}\n\n"
+        f"Technical Concerns:\n{_bullets(data['technical_concerns'])}\n\n"
+        f"Scalability Considerations:\n{_bullets(data['scalability_considerations'])}"
+    )
+
+
+def _render_revenue(data: Dict[str, Any]) -> str:
+    return (
+        f"Revenue Analysis: {data['revenue_analysis']}\n\n"
+        f"Revenue Requirements:\n{_bullets(data['revenue_requirements'])}\n\n"
+        f"Revenue Concerns:\n{_bullets(data['revenue_concerns'])}\n\n"
+        f"Monetization Strategies:\n{_bullets(data['monetization_strategies'])}\n\n"
+        f"Pricing Considerations:\n{_bullets(data['pricing_considerations'])}"
+    )
+
+
+_ANALYSIS_RENDERERS = {
+    "domain_expert_analysis": _render_domain_expert,
+    "ux_ui_specialist_analysis": _render_ux_ui,
+    "technical_architect_analysis": _render_technical,
+    "revenue_model_analyst_analysis": _render_revenue,
+}
+
+
+def render_analysis(state_key: str, value: Any) -> Any:
+    """Render a stored specialist result to markdown text.
+
+    Values that are already strings (timeout placeholders, legacy state)
+    pass through unchanged, as does None.
+
+    Args:
+        state_key: OverallState key the value was stored under
+        value: Structured dict or pre-rendered string
+
+    Returns:
+        Markdown text for dict values, otherwise the value unchanged
+    """
+    if not isinstance(value, dict):
+        return value
+    renderer = _ANALYSIS_RENDERERS.get(state_key)
+    return renderer(value) if renderer else str(value)
+
+
+# Precompiled multi-pattern matcher for debate detection: one pass over the
+# query instead of a Python-level substring scan (plus a lowercased copy of
+# the query) per keyword
+_DEBATE_KEYWORDS = ("debate", "conflict", "disagreement", "argument", "dispute", "controversy")
+_DEBATE_PATTERN = re.compile("|".join(_DEBATE_KEYWORDS), re.IGNORECASE)
+
+
+# Shared executor for blocking pre/post-processing inside async nodes. The
+# MongoDB memory operations are synchronous pymongo calls (connect, reads,
+# writes) that would otherwise stall the event loop and every other
+# request's awaits while they run.
+_BLOCKING_POOL = ThreadPoolExecutor(
+    max_workers=os.cpu_count() or 4, thread_name_prefix="agent-blocking"
+)
+
+
+async def _run_blocking(fn, *args):
+    """Run a blocking callable on the shared executor without stalling the loop."""
+    return await asyncio.get_running_loop().run_in_executor(_BLOCKING_POOL, fn, *args)
+
+
+# Semantic caches, one per query-driven node: paraphrased queries ("Design a
+# checkout flow" vs "Build a checkout UX") miss the exact-match cache but land
+# within cosine 0.95 of each other, so the prior structured result is reused
+# without an LLM call. Each entry is None when the optional embedding
+# dependencies are not installed, which disables the layer cleanly.
+_SEMANTIC_NODE_CACHES: Dict[str, Any] = {
+    name: create_semantic_cache(similarity_threshold=0.95)
+    for name in (
+        "classify_query",
+        "domain_expert",
+        "ux_ui_specialist",
+        "technical_architect",
+        "revenue_model_analyst",
+    )
+}
+
+
+async def semantic_cached_ainvoke(node: str, query: str, llm: Any, llm_input: Any,
+                                  model: str, temperature: float, schema: type) -> Any:
+    """Invoke an LLM with the node's semantic cache in front of the exact-match one.
+
+    Embedding lookups are CPU-bound, so they run on the blocking pool rather
+    than on the event loop.
+
+    Args:
+        node: Name of the node whose semantic cache should be consulted
+        query: User query text used as the similarity key
+        llm: Structured LLM wrapper to invoke on a miss
+        llm_input: Prompt string or message list to pass through
+        model: The Gemini model name (part of the exact-match key)
+        temperature: Sampling temperature (part of the exact-match key)
+        schema: Structured output schema class
+
+    Returns:
+        The cached or freshly generated structured result
+    """
+    cache = _SEMANTIC_NODE_CACHES.get(node)
+    if cache is not None:
+        hit = await _run_blocking(cache.get, query)
+        if hit is not None:
+            return hit
+    result = await cached_ainvoke(llm, llm_input, model, temperature, schema)
+    if cache is not None:
+        await _run_blocking(cache.add, query, result)
+    return result
+
+
+# Placeholder analysis for a specialist whose LLM call exceeded the per-node
+# timeout: the graph degrades to the remaining analyses instead of stalling
+_TIMEOUT_ANALYSIS = "[unavailable: timeout]"
 
-def get_genai_client():
-    """Get or create the genai client instance."""
-    global _genai_client
-    if _genai_client is None:
-        api_key = os.getenv("GEMINI_API_KEY")
-        if api_key is None:
-            raise ValueError("GEMINI_API_KEY is not set")
-        _genai_client = Client(api_key=api_key)
-    return _genai_client
+
+def _timeout_update(state: OverallState, agent: str, analysis_key: str, start_time: float) -> OverallState:
+    """Build the degraded state update for a specialist whose LLM call timed out."""
+    agent_history = state.get("agent_history", [])
+    agent_history.append({
+        "step": state.get("current_step", 1),
+        "agent": agent,
+        "analysis_completed": False,
+        "timed_out": True,
+        "timestamp": time.time()
+    })
+    return {
+        analysis_key: _TIMEOUT_ANALYSIS,
+        "agent_history": agent_history,
+        "processing_time": time.time() - start_time
+    }
+
+
+# Node-level memoization: even when a full response is not cacheable, an
+# individual specialist's output for the same inputs usually recurs across
+# different higher-level queries. Keyed by (node name, hash of the state
+# slice the node actually reads).
+_AGENT_CACHE: LRUCache = LRUCache(maxsize=4096)
+
+
+def memoize_node(name: str, state_keys: Tuple[str, ...] = ("user_query",)):
+    """Memoize an agent node's analysis output on the state slice it reads.
+
+    On a hit the node's LLM call is skipped entirely; the agent_history
+    entry and processing_time are still produced fresh for the current
+    request so the workflow trace stays accurate.
+
+    Args:
+        name: Agent name recorded in agent_history
+        state_keys: State fields that determine the node's output
+
+    Returns:
+        Decorator wrapping an async node function
+    """
+    def decorator(node_fn):
+        @functools.wraps(node_fn)
+        async def wrapper(state: OverallState, config: RunnableConfig) -> OverallState:
+            digest = hashlib.blake2b(
+                "|".join(str(state.get(key) or "") for key in state_keys).encode(),
+                digest_size=16,
+            ).digest()
+            cache_key = (name, digest)
+
+            cached = _AGENT_CACHE.get(cache_key)
+            if cached is not None:
+                start_time = time.time()
+                agent_history = state.get("agent_history", [])
+                agent_history.append({
+                    "step": state.get("current_step", 1),
+                    "agent": name,
+                    "analysis_completed": True,
+                    "from_cache": True,
+                    "timestamp": time.time()
+                })
+                return {
+                    **cached,
+                    "agent_history": agent_history,
+                    "processing_time": time.time() - start_time
+                }
+
+            update = await node_fn(state, config)
+            # Degraded (timed-out) output must not be replayed from cache
+            if _TIMEOUT_ANALYSIS not in update.values():
+                _AGENT_CACHE[cache_key] = {
+                    key: value for key, value in update.items()
+                    if key not in ("agent_history", "processing_time")
+                }
+            return update
+        return wrapper
+    return decorator
 
 
 # Supervisor Node - The main orchestrator
@@ -86,14 +363,15 @@ async def supervisor_node(state: OverallState, config: RunnableConfig) -> Overal
     # Get thread_id from config
     thread_id = configurable.thread_id if hasattr(configurable, 'thread_id') else None
     
-    # Initialize memory manager
-    memory_manager = create_memory_manager()
-    
+    # Initialize memory manager off-loop: connecting and pinging MongoDB is
+    # synchronous and would block every other request while it runs
+    memory_manager = await _run_blocking(create_memory_manager)
+
     # Retrieve conversation history if thread_id is available
     conversation_context = ""
     if thread_id:
         try:
-            history = memory_manager.get_conversation_history(thread_id, limit=5)
+            history = await _run_blocking(memory_manager.get_conversation_history, thread_id, 5)
             if history:
                 conversation_context = "\n\nPrevious Conversation Context:\n"
                 for entry in reversed(history):  # Show most recent first
@@ -103,34 +381,31 @@ async def supervisor_node(state: OverallState, config: RunnableConfig) -> Overal
         except Exception as e:
             print(f"Warning: Could not retrieve conversation history: {e}")
     
-    # Initialize Gemini 2.0 Flash for supervisor analysis
-    llm = ChatGoogleGenerativeAI(
-        model=configurable.model,
-        temperature=0.3,
-        max_retries=2,
-        api_key=os.getenv("GEMINI_API_KEY"),
-    )
-    structured_llm = llm.with_structured_output(SupervisorAnalysis)
+    # Get the shared structured client for supervisor analysis
+    structured_llm = get_structured_llm(configurable.model, 0.3, SupervisorAnalysis)
     
-    # Format the prompt with current state and conversation history
+    # Static instructions as a stable system-message prefix for prompt caching
     current_date = get_current_date()
-    formatted_prompt = supervisor_instructions.format(
-        user_query=state["user_query"],
-        current_step=state.get("current_step", 1),
-        max_steps=state.get("max_steps", 10),
-        agent_history=state.get("agent_history", []),
-        domain_expert_analysis=state.get("domain_expert_analysis", "Not completed"),
-        ux_ui_specialist_analysis=state.get("ux_ui_specialist_analysis", "Not completed"),
-        technical_architect_analysis=state.get("technical_architect_analysis", "Not completed"),
-        revenue_model_analyst_analysis=state.get("revenue_model_analyst_analysis", "Not completed"),
-        moderator_aggregation=state.get("moderator_aggregation", "Not completed"),
-        debate_resolution=state.get("debate_resolution", "Not applicable"),
-        current_date=current_date,
-        conversation_context=conversation_context,
-    )
-    
+    messages = [
+        _SUPERVISOR_SYSTEM_MESSAGE,
+        HumanMessage(content=supervisor_query_instructions.format(
+            user_query=state["user_query"],
+            current_step=state.get("current_step", 1),
+            max_steps=state.get("max_steps", 10),
+            agent_history=state.get("agent_history", []),
+            domain_expert_analysis=render_analysis("domain_expert_analysis", state.get("domain_expert_analysis")) or "Not completed",
+            ux_ui_specialist_analysis=render_analysis("ux_ui_specialist_analysis", state.get("ux_ui_specialist_analysis")) or "Not completed",
+            technical_architect_analysis=render_analysis("technical_architect_analysis", state.get("technical_architect_analysis")) or "Not completed",
+            revenue_model_analyst_analysis=render_analysis("revenue_model_analyst_analysis", state.get("revenue_model_analyst_analysis")) or "Not completed",
+            moderator_aggregation=state.get("moderator_aggregation", "Not completed"),
+            debate_resolution=state.get("debate_resolution", "Not applicable"),
+            current_date=current_date,
+            conversation_context=conversation_context,
+        )),
+    ]
+
     # Get supervisor decision using async execution
-    result = await structured_llm.ainvoke(formatted_prompt)
+    result = await bounded_ainvoke(structured_llm, messages)
     
     # Update agent history
     agent_history = state.get("agent_history", [])
@@ -146,7 +421,7 @@ async def supervisor_node(state: OverallState, config: RunnableConfig) -> Overal
     # Save conversation memory if thread_id is available
     if thread_id:
         try:
-            memory_manager.save_conversation_memory(thread_id, state)
+            await _run_blocking(memory_manager.save_conversation_memory, thread_id, state)
         except Exception as e:
             print(f"Warning: Could not save conversation memory: {e}")
     
@@ -174,44 +449,60 @@ async def classify_query(state: OverallState, config: RunnableConfig) -> Overall
     configurable = Configuration.from_runnable_config(config)
     start_time = time.time()
     
-    # Initialize Gemini 2.0 Flash for query classification
-    llm = ChatGoogleGenerativeAI(
-        model=configurable.model,
-        temperature=0.3,
-        max_retries=2,
-        api_key=os.getenv("GEMINI_API_KEY"),
-    )
-    structured_llm = llm.with_structured_output(QueryClassification)
+    # Get the shared structured client for query classification
+    structured_llm = get_structured_llm(configurable.model, 0.3, QueryClassification)
     
-    # Format the prompt
+    # Static instructions as a stable system-message prefix for prompt caching
     current_date = get_current_date()
-    formatted_prompt = query_classification_instructions.format(
-        user_query=state["user_query"],
-        current_date=current_date,
-    )
-    
+    messages = [
+        _CLASSIFY_SYSTEM_MESSAGE,
+        HumanMessage(content=query_classification_query_instructions.format(
+            user_query=state["user_query"],
+            current_date=current_date,
+        )),
+    ]
+
     # Classify the query using async execution
-    result = await structured_llm.ainvoke(formatted_prompt)
-    
-    # Check if this is a debate (contains debate keywords)
-    debate_keywords = ["debate", "conflict", "disagreement", "argument", "dispute", "controversy"]
-    is_debate = any(keyword in state["user_query"].lower() for keyword in debate_keywords)
+    result = await semantic_cached_ainvoke(
+        "classify_query", state["user_query"],
+        structured_llm, messages, configurable.model, 0.3, QueryClassification,
+    )
     
+    # Check if this is a debate: keyword fast path plus the classifier's own
+    # fused debate detection (replaces the former analyze_debate LLM hop)
+    is_debate = _DEBATE_PATTERN.search(state["user_query"]) is not None or result.is_debate
+
+    # Attach the precomputed domain fragment so downstream analysis can build
+    # on the cached boilerplate instead of regenerating it
+    cag_prefix = _detect_cag_domain(state["user_query"])
+
     if is_debate:
+        debate_category = result.debate_category or DebateCategory.MODERATOR
         return {
             "query_type": QueryType.GENERAL,
-            "debate_category": DebateCategory.MODERATOR,
+            "classification_confidence": result.confidence_score,
+            "debate_category": debate_category,
+            "debate_resolution": f"""
+Debate Analysis:
+- Category: {debate_category.value}
+- Routing Decision: {result.routing_decision or "Route to moderator for resolution"}
+- Urgency Level: {result.urgency_level or "Medium"}
+            """.strip(),
+            "cag_prefix": cag_prefix,
             "processing_time": time.time() - start_time
         }
-    
+
     return {
         "query_type": result.query_type,
+        "classification_confidence": result.confidence_score,
         "debate_category": None,
+        "cag_prefix": cag_prefix,
         "processing_time": time.time() - start_time
     }
 
 
 # Specialist Agent Nodes (now callable by Supervisor)
+@memoize_node("domain_expert", ("user_query", "cag_prefix"))
 async def domain_expert_analysis(state: OverallState, config: RunnableConfig) -> OverallState:
     """Domain Expert analysis node.
     
@@ -227,28 +518,40 @@ async def domain_expert_analysis(state: OverallState, config: RunnableConfig) ->
     
     # Get thread_id from config
     thread_id = configurable.thread_id if hasattr(configurable, 'thread_id') else None
+
+    # Initialize memory manager off-loop, and only when it will be used
+    memory_manager = await _run_blocking(create_memory_manager) if thread_id else None
+
+    # Get the shared structured client for domain expert analysis
+    structured_llm = get_structured_llm(configurable.model, 0.7, DomainExpertAnalysis)
     
-    # Initialize memory manager
-    memory_manager = create_memory_manager()
-    
-    # Initialize Gemini 2.0 Flash for domain expert analysis
-    llm = ChatGoogleGenerativeAI(
-        model=configurable.model,
-        temperature=0.7,
-        max_retries=2,
-        api_key=os.getenv("GEMINI_API_KEY"),
-    )
-    structured_llm = llm.with_structured_output(DomainExpertAnalysis)
-    
-    # Format the prompt
+    # Keep the static instructions as a stable system-message prefix so the
+    # provider can reuse its prompt cache; only the query block varies
     current_date = get_current_date()
-    formatted_prompt = domain_expert_instructions.format(
-        user_query=state["user_query"],
-        current_date=current_date,
+    messages = [
+        _DOMAIN_EXPERT_SYSTEM_MESSAGE,
+    ]
+    # Inject the cached domain fragment (if the query matched a known domain)
+    # so the model differentials on the query-specific part only
+    if state.get("cag_prefix"):
+        messages.append(SystemMessage(content=state["cag_prefix"]))
+    messages.append(
+        HumanMessage(content=domain_expert_query_instructions.format(
+            user_query=state["user_query"],
+            current_date=current_date,
+        ))
     )
-    
-    # Generate domain expert analysis using async execution
-    result = await structured_llm.ainvoke(formatted_prompt)
+
+    # Generate domain expert analysis, bounding the call so one slow LLM
+    # round-trip cannot stall the whole graph
+    try:
+        async with asyncio.timeout(configurable.per_node_timeout_s):
+            result = await semantic_cached_ainvoke(
+                "domain_expert", state["user_query"],
+                structured_llm, messages, configurable.model, 0.7, DomainExpertAnalysis,
+            )
+    except TimeoutError:
+        return _timeout_update(state, "domain_expert", "domain_expert_analysis", start_time)
     
     # Update agent history
     agent_history = state.get("agent_history", [])
@@ -259,19 +562,9 @@ async def domain_expert_analysis(state: OverallState, config: RunnableConfig) ->
         "timestamp": time.time()
     })
     
-    # Prepare updated state
+    # Prepare updated state (structured; rendered at the edges)
     updated_state = {
-        "domain_expert_analysis": f"""
-Domain Analysis: {result.domain_analysis}
-
-Domain Requirements:
-{chr(10).join(f"- {req}" for req in result.domain_requirements)}
-
-Domain Concerns:
-{chr(10).join(f"- {concern}" for concern in result.domain_concerns)}
-
-Priority Level: {result.priority_level}
-        """.strip(),
+        "domain_expert_analysis": result.model_dump(),
         "agent_history": agent_history,
         "processing_time": time.time() - start_time
     }
@@ -281,13 +574,14 @@ Priority Level: {result.priority_level}
         try:
             # Merge current state with updates
             current_state = {**state, **updated_state}
-            memory_manager.save_conversation_memory(thread_id, current_state)
+            await _run_blocking(memory_manager.save_conversation_memory, thread_id, current_state)
         except Exception as e:
             print(f"Warning: Could not save conversation memory: {e}")
     
     return updated_state
 
 
+@memoize_node("ux_ui_specialist")
 async def ux_ui_specialist_analysis(state: OverallState, config: RunnableConfig) -> OverallState:
     """UX/UI Specialist analysis node.
     
@@ -301,24 +595,28 @@ async def ux_ui_specialist_analysis(state: OverallState, config: RunnableConfig)
     configurable = Configuration.from_runnable_config(config)
     start_time = time.time()
     
-    # Initialize Gemini 2.0 Flash for UX/UI specialist analysis
-    llm = ChatGoogleGenerativeAI(
-        model=configurable.model,
-        temperature=0.7,
-        max_retries=2,
-        api_key=os.getenv("GEMINI_API_KEY"),
-    )
-    structured_llm = llm.with_structured_output(UXUISpecialistAnalysis)
+    # Get the shared structured client for UX/UI specialist analysis
+    structured_llm = get_structured_llm(configurable.model, 0.7, UXUISpecialistAnalysis)
     
-    # Format the prompt
+    # Static instructions as a stable system-message prefix for prompt caching
     current_date = get_current_date()
-    formatted_prompt = ux_ui_specialist_instructions.format(
-        user_query=state["user_query"],
-        current_date=current_date,
-    )
-    
-    # Generate UX/UI specialist analysis using async execution
-    result = await structured_llm.ainvoke(formatted_prompt)
+    messages = [
+        _UX_UI_SYSTEM_MESSAGE,
+        HumanMessage(content=ux_ui_specialist_query_instructions.format(
+            user_query=state["user_query"],
+            current_date=current_date,
+        )),
+    ]
+
+    # Generate UX/UI specialist analysis, bounded by the per-node timeout
+    try:
+        async with asyncio.timeout(configurable.per_node_timeout_s):
+            result = await semantic_cached_ainvoke(
+                "ux_ui_specialist", state["user_query"],
+                structured_llm, messages, configurable.model, 0.7, UXUISpecialistAnalysis,
+            )
+    except TimeoutError:
+        return _timeout_update(state, "ux_ui_specialist", "ux_ui_specialist_analysis", start_time)
     
     # Update agent history
     agent_history = state.get("agent_history", [])
@@ -330,23 +628,13 @@ async def ux_ui_specialist_analysis(state: OverallState, config: RunnableConfig)
     })
     
     return {
-        "ux_ui_specialist_analysis": f"""
-UX Analysis: {result.ux_analysis}
-
-UI Requirements:
-{chr(10).join(f"- {req}" for req in result.ui_requirements)}
-
-User Experience Concerns:
-{chr(10).join(f"- {concern}" for concern in result.user_experience_concerns)}
-
-Accessibility Requirements:
-{chr(10).join(f"- {req}" for req in result.accessibility_requirements)}
-        """.strip(),
+        "ux_ui_specialist_analysis": result.model_dump(),
         "agent_history": agent_history,
         "processing_time": time.time() - start_time
     }
 
 
+@memoize_node("technical_architect")
 async def technical_architect_analysis(state: OverallState, config: RunnableConfig) -> OverallState:
     """Technical Architect analysis node.
     
@@ -360,24 +648,28 @@ async def technical_architect_analysis(state: OverallState, config: RunnableConf
     configurable = Configuration.from_runnable_config(config)
     start_time = time.time()
     
-    # Initialize Gemini 2.0 Flash for technical architect analysis
-    llm = ChatGoogleGenerativeAI(
-        model=configurable.model,
-        temperature=0.7,
-        max_retries=2,
-        api_key=os.getenv("GEMINI_API_KEY"),
-    )
-    structured_llm = llm.with_structured_output(TechnicalArchitectAnalysis)
+    # Get the shared structured client for technical architect analysis
+    structured_llm = get_structured_llm(configurable.model, 0.7, TechnicalArchitectAnalysis)
     
-    # Format the prompt
+    # Static instructions as a stable system-message prefix for prompt caching
     current_date = get_current_date()
-    formatted_prompt = technical_architect_instructions.format(
-        user_query=state["user_query"],
-        current_date=current_date,
-    )
-    
-    # Generate technical architect analysis using async execution
-    result = await structured_llm.ainvoke(formatted_prompt)
+    messages = [
+        _TECHNICAL_SYSTEM_MESSAGE,
+        HumanMessage(content=technical_architect_query_instructions.format(
+            user_query=state["user_query"],
+            current_date=current_date,
+        )),
+    ]
+
+    # Generate technical architect analysis, bounded by the per-node timeout
+    try:
+        async with asyncio.timeout(configurable.per_node_timeout_s):
+            result = await semantic_cached_ainvoke(
+                "technical_architect", state["user_query"],
+                structured_llm, messages, configurable.model, 0.7, TechnicalArchitectAnalysis,
+            )
+    except TimeoutError:
+        return _timeout_update(state, "technical_architect", "technical_architect_analysis", start_time)
     
     # Update agent history
     agent_history = state.get("agent_history", [])
@@ -389,23 +681,13 @@ async def technical_architect_analysis(state: OverallState, config: RunnableConf
     })
     
     return {
-        "technical_architect_analysis": f"""
-Technical Analysis: {result.technical_analysis}
-
-Technical Requirements:
-{chr(10).join(f"- {req}" for req in result.technical_requirements)}
-
-Technical Concerns:
-{chr(10).join(f"- {concern}" for concern in result.technical_concerns)}
-
-Scalability Considerations:
-{chr(10).join(f"- {consideration}" for consideration in result.scalability_considerations)}
-        """.strip(),
+        "technical_architect_analysis": result.model_dump(),
         "agent_history": agent_history,
         "processing_time": time.time() - start_time
     }
 
 
+@memoize_node("revenue_model_analyst")
 async def revenue_model_analyst_analysis(state: OverallState, config: RunnableConfig) -> OverallState:
     """Revenue Model Analyst analysis node.
     
@@ -419,24 +701,28 @@ async def revenue_model_analyst_analysis(state: OverallState, config: RunnableCo
     configurable = Configuration.from_runnable_config(config)
     start_time = time.time()
     
-    # Initialize Gemini 2.0 Flash for revenue model analyst analysis
-    llm = ChatGoogleGenerativeAI(
-        model=configurable.model,
-        temperature=0.7,
-        max_retries=2,
-        api_key=os.getenv("GEMINI_API_KEY"),
-    )
-    structured_llm = llm.with_structured_output(RevenueModelAnalystAnalysis)
+    # Get the shared structured client for revenue model analyst analysis
+    structured_llm = get_structured_llm(configurable.model, 0.7, RevenueModelAnalystAnalysis)
     
-    # Format the prompt
+    # Static instructions as a stable system-message prefix for prompt caching
     current_date = get_current_date()
-    formatted_prompt = revenue_model_analyst_instructions.format(
-        user_query=state["user_query"],
-        current_date=current_date,
-    )
-    
-    # Generate revenue model analyst analysis using async execution
-    result = await structured_llm.ainvoke(formatted_prompt)
+    messages = [
+        _REVENUE_SYSTEM_MESSAGE,
+        HumanMessage(content=revenue_model_analyst_query_instructions.format(
+            user_query=state["user_query"],
+            current_date=current_date,
+        )),
+    ]
+
+    # Generate revenue model analyst analysis, bounded by the per-node timeout
+    try:
+        async with asyncio.timeout(configurable.per_node_timeout_s):
+            result = await semantic_cached_ainvoke(
+                "revenue_model_analyst", state["user_query"],
+                structured_llm, messages, configurable.model, 0.7, RevenueModelAnalystAnalysis,
+            )
+    except TimeoutError:
+        return _timeout_update(state, "revenue_model_analyst", "revenue_model_analyst_analysis", start_time)
     
     # Update agent history
     agent_history = state.get("agent_history", [])
@@ -448,82 +734,19 @@ async def revenue_model_analyst_analysis(state: OverallState, config: RunnableCo
     })
     
     return {
-        "revenue_model_analyst_analysis": f"""
-Revenue Analysis: {result.revenue_analysis}
-
-Revenue Requirements:
-{chr(10).join(f"- {req}" for req in result.revenue_requirements)}
-
-Revenue Concerns:
-{chr(10).join(f"- {concern}" for concern in result.revenue_concerns)}
-
-Monetization Strategies:
-{chr(10).join(f"- {strategy}" for strategy in result.monetization_strategies)}
-
-Pricing Considerations:
-{chr(10).join(f"- {consideration}" for consideration in result.pricing_considerations)}
-        """.strip(),
-        "agent_history": agent_history,
-        "processing_time": time.time() - start_time
-    }
-
-
-async def analyze_debate(state: OverallState, config: RunnableConfig) -> OverallState:
-    """Debate analysis and routing node.
-    
-    Args:
-        state: Current graph state containing the debate content
-        config: Configuration for the runnable
-        
-    Returns:
-        Dictionary with state update containing debate analysis and routing decision
-    """
-    configurable = Configuration.from_runnable_config(config)
-    start_time = time.time()
-    
-    # Initialize Gemini 2.0 Flash for debate analysis
-    llm = ChatGoogleGenerativeAI(
-        model=configurable.model,
-        temperature=0.5,
-        max_retries=2,
-        api_key=os.getenv("GEMINI_API_KEY"),
-    )
-    structured_llm = llm.with_structured_output(DebateAnalysis)
-    
-    # Format the prompt
-    current_date = get_current_date()
-    formatted_prompt = debate_analysis_instructions.format(
-        debate_content=state.get("debate_content", state["user_query"]),
-        user_query=state["user_query"],
-        current_date=current_date,
-    )
-    
-    # Generate debate analysis using async execution
-    result = await structured_llm.ainvoke(formatted_prompt)
-    
-    # Update agent history
-    agent_history = state.get("agent_history", [])
-    agent_history.append({
-        "step": state.get("current_step", 1),
-        "agent": "debate_analyzer",
-        "debate_category": result.debate_category.value,
-        "timestamp": time.time()
-    })
-    
-    return {
-        "debate_category": result.debate_category,
-        "debate_resolution": f"""
-Debate Analysis:
-- Category: {result.debate_category.value}
-- Routing Decision: {result.routing_decision}
-- Urgency Level: {result.urgency_level}
-- Estimated Resolution Time: {result.estimated_resolution_time}
-        """.strip(),
+        "revenue_model_analyst_analysis": result.model_dump(),
         "agent_history": agent_history,
         "processing_time": time.time() - start_time
     }
 
 
+@memoize_node("moderator", (
+    "user_query",
+    "domain_expert_analysis",
+    "ux_ui_specialist_analysis",
+    "technical_architect_analysis",
+    "revenue_model_analyst_analysis",
+))
 async def moderator_aggregation(state: OverallState, config: RunnableConfig) -> OverallState:
     """Moderator/Aggregator analysis node.
     
@@ -537,28 +760,25 @@ async def moderator_aggregation(state: OverallState, config: RunnableConfig) ->
     configurable = Configuration.from_runnable_config(config)
     start_time = time.time()
     
-    # Initialize Gemini 2.0 Flash for moderator aggregation
-    llm = ChatGoogleGenerativeAI(
-        model=configurable.model,
-        temperature=0.5,
-        max_retries=2,
-        api_key=os.getenv("GEMINI_API_KEY"),
-    )
-    structured_llm = llm.with_structured_output(ModeratorAggregation)
+    # Get the shared structured client for moderator aggregation
+    structured_llm = get_structured_llm(configurable.model, 0.5, ModeratorAggregation)
     
-    # Format the prompt
+    # Static instructions as a stable system-message prefix for prompt caching
     current_date = get_current_date()
-    formatted_prompt = moderator_aggregation_instructions.format(
-        domain_analysis=state.get("domain_expert_analysis", "No domain analysis provided"),
-        ux_analysis=state.get("ux_ui_specialist_analysis", "No UX/UI analysis provided"),
-        technical_analysis=state.get("technical_architect_analysis", "No technical analysis provided"),
-        revenue_analysis=state.get("revenue_model_analyst_analysis", "No revenue analysis provided"),
-        user_query=state["user_query"],
-        current_date=current_date,
-    )
-    
+    messages = [
+        _MODERATOR_SYSTEM_MESSAGE,
+        HumanMessage(content=moderator_aggregation_query_instructions.format(
+            domain_analysis=render_analysis("domain_expert_analysis", state.get("domain_expert_analysis")) or "No domain analysis provided",
+            ux_analysis=render_analysis("ux_ui_specialist_analysis", state.get("ux_ui_specialist_analysis")) or "No UX/UI analysis provided",
+            technical_analysis=render_analysis("technical_architect_analysis", state.get("technical_architect_analysis")) or "No technical analysis provided",
+            revenue_analysis=render_analysis("revenue_model_analyst_analysis", state.get("revenue_model_analyst_analysis")) or "No revenue analysis provided",
+            user_query=state["user_query"],
+            current_date=current_date,
+        )),
+    ]
+
     # Generate moderator aggregation using async execution
-    result = await structured_llm.ainvoke(formatted_prompt)
+    result = await cached_ainvoke(structured_llm, messages, configurable.model, 0.5, ModeratorAggregation)
     
     # Update agent history
     agent_history = state.get("agent_history", [])
@@ -572,16 +792,16 @@ async def moderator_aggregation(state: OverallState, config: RunnableConfig) ->
     return {
         "moderator_aggregation": f"""
 Aggregated Requirements:
-{chr(10).join(f"- {req}" for req in result.aggregated_requirements)}
+{_bullets(result.aggregated_requirements)}
 
 Conflict Resolution:
 {result.conflict_resolution if result.conflict_resolution else "No conflicts identified"}
 
 Final Recommendations:
-{chr(10).join(f"- {rec}" for rec in result.final_recommendations)}
+{_bullets(result.final_recommendations)}
 
 Implementation Priority:
-{chr(10).join(f"- {priority}" for priority in result.implementation_priority)}
+{_bullets(result.implementation_priority)}
         """.strip(),
         "agent_history": agent_history,
         "processing_time": time.time() - start_time
@@ -601,24 +821,38 @@ async def finalize_answer(state: OverallState, config: RunnableConfig) -> Overal
     configurable = Configuration.from_runnable_config(config)
     start_time = time.time()
     
-    # Initialize Gemini 2.0 Flash for final answer generation
-    llm = ChatGoogleGenerativeAI(
-        model=configurable.model,
-        temperature=0.3,
-        max_retries=2,
-        api_key=os.getenv("GEMINI_API_KEY"),
-    )
+    # Get the shared Gemini client for final answer generation
+    llm = get_llm(configurable.model, 0.3)
     
-    # Format the prompt
+    # Static instructions as a stable system-message prefix for prompt caching
     current_date = get_current_date()
-    formatted_prompt = final_answer_instructions.format(
-        user_query=state["user_query"],
-        moderator_aggregation=state.get("moderator_aggregation", "No aggregation available"),
-        current_date=current_date,
-    )
-    
-    # Generate final answer using async execution
-    result = await llm.ainvoke(formatted_prompt)
+    # When a single targeted specialist ran there is no moderator
+    # aggregation; fall back to the lone specialist analysis
+    aggregation = state.get("moderator_aggregation")
+    if not aggregation:
+        aggregation = next(
+            (render_analysis(key, state[key]) for key in (
+                "domain_expert_analysis",
+                "ux_ui_specialist_analysis",
+                "technical_architect_analysis",
+                "revenue_model_analyst_analysis",
+            ) if state.get(key)),
+            "No aggregation available",
+        )
+    messages = [
+        _FINAL_ANSWER_SYSTEM_MESSAGE,
+        HumanMessage(content=final_answer_query_instructions.format(
+            user_query=state["user_query"],
+            moderator_aggregation=aggregation,
+            current_date=current_date,
+        )),
+    ]
+
+    # Stream the final answer token-by-token: astream_events surfaces the
+    # chunks to the SSE layer while the model generates, collapsing the
+    # user's time-to-first-token from the full generation to the first chunk.
+    # The accumulated text still lands in state for checkpointing.
+    final_answer = await cached_astream_text(llm, messages, configurable.model, 0.3)
     
     # Update agent history
     agent_history = state.get("agent_history", [])
@@ -630,14 +864,86 @@ async def finalize_answer(state: OverallState, config: RunnableConfig) -> Overal
     })
     
     return {
-        "messages": [AIMessage(content=result.content)],
-        "final_answer": result.content,
+        "messages": [AIMessage(content=final_answer)],
+        "final_answer": final_answer,
         "agent_history": agent_history,
         "is_complete": True,
         "processing_time": time.time() - start_time
     }
 
 
+async def parallel_specialists(state: OverallState, config: RunnableConfig) -> OverallState:
+    """Run all specialist analyses concurrently with asyncio.gather.
+
+    The four specialist analyses only depend on the user query, so for general
+    queries they can be dispatched as concurrent coroutines instead of
+    sequential supervisor round-trips. This collapses four LLM round-trips
+    into a single max(RTT) wall-clock window.
+
+    Args:
+        state: Current graph state containing the user query
+        config: Configuration for the runnable
+
+    Returns:
+        Dictionary with state update containing all specialist analyses
+    """
+    configurable = Configuration.from_runnable_config(config)
+    start_time = time.time()
+
+    # Fall back to supervisor-driven sequential routing when disabled
+    if not configurable.enable_parallel_processing:
+        return {}
+
+    # Dispatch all specialist analyses concurrently; return_exceptions keeps
+    # one failing specialist from tearing down the others
+    results = await asyncio.gather(
+        domain_expert_analysis(state, config),
+        ux_ui_specialist_analysis(state, config),
+        technical_architect_analysis(state, config),
+        revenue_model_analyst_analysis(state, config),
+        return_exceptions=True,
+    )
+
+    updated_state: Dict[str, Any] = {}
+    for result in results:
+        # BaseException also catches a CancelledError leaking out of a
+        # coalesced call, which gather aggregates like any other failure
+        if isinstance(result, BaseException):
+            print(f"Warning: Specialist analysis failed: {result}")
+            continue
+        for key, value in result.items():
+            # Each specialist appends to the shared agent_history list and
+            # reports its own processing_time; merge only the analysis fields
+            if key not in ("agent_history", "processing_time"):
+                updated_state[key] = value
+
+    return {
+        **updated_state,
+        "agent_history": state.get("agent_history", []),
+        "processing_time": time.time() - start_time,
+    }
+
+
+# Direct routes from the supervisor's chosen agent to its node
+_AGENT_ROUTES = {
+    AgentType.DOMAIN_EXPERT: "domain_expert",
+    AgentType.UX_UI_SPECIALIST: "ux_ui_specialist",
+    AgentType.TECHNICAL_ARCHITECT: "technical_architect",
+    AgentType.REVENUE_MODEL_ANALYST: "revenue_model_analyst",
+    AgentType.MODERATOR: "moderator_aggregation",
+}
+
+# Direct routes from a debate category (resolved during classification) to
+# the node that should handle the resolution
+_DEBATE_ROUTES = {
+    DebateCategory.DOMAIN_EXPERT: "domain_expert",
+    DebateCategory.UX_UI_SPECIALIST: "ux_ui_specialist",
+    DebateCategory.TECHNICAL_ARCHITECT: "technical_architect",
+    DebateCategory.REVENUE_MODEL_ANALYST: "revenue_model_analyst",
+    DebateCategory.MODERATOR: "moderator_aggregation",
+}
+
+
 # Router function for Supervisor-based routing
 def supervisor_router(state: OverallState) -> str:
     """Router function that determines the next node based on Supervisor decision.
@@ -668,22 +974,13 @@ def supervisor_router(state: OverallState) -> str:
     if supervisor_decision == SupervisorDecision.END:
         return "finalize_answer"
     elif supervisor_decision == SupervisorDecision.DEBATE:
-        return "analyze_debate"
+        # Debate detection and routing are fused into classification, so the
+        # debate goes straight to the specialist its category names
+        return _DEBATE_ROUTES.get(state.get("debate_category"), "moderator_aggregation")
     elif supervisor_decision == SupervisorDecision.CONTINUE:
         # Route to the specific agent the supervisor chose
-        if active_agent == AgentType.DOMAIN_EXPERT:
-            return "domain_expert"
-        elif active_agent == AgentType.UX_UI_SPECIALIST:
-            return "ux_ui_specialist"
-        elif active_agent == AgentType.TECHNICAL_ARCHITECT:
-            return "technical_architect"
-        elif active_agent == AgentType.REVENUE_MODEL_ANALYST:
-            return "revenue_model_analyst"
-        elif active_agent == AgentType.MODERATOR:
-            return "moderator_aggregation"
-        else:
-            # Default to supervisor for unknown agent
-            return "supervisor"
+        # (defaulting to supervisor for an unknown agent)
+        return _AGENT_ROUTES.get(active_agent, "supervisor")
     
     # Default fallback
     return "supervisor"
@@ -699,35 +996,124 @@ builder.add_node("domain_expert", domain_expert_analysis)
 builder.add_node("ux_ui_specialist", ux_ui_specialist_analysis)
 builder.add_node("technical_architect", technical_architect_analysis)
 builder.add_node("revenue_model_analyst", revenue_model_analyst_analysis)
-builder.add_node("analyze_debate", analyze_debate)
 builder.add_node("moderator_aggregation", moderator_aggregation)
+builder.add_node("parallel_specialists", parallel_specialists)
 builder.add_node("finalize_answer", finalize_answer)
 
 # Set the entrypoint
 builder.add_edge(START, "classify_query")
 
+
+# Direct routes for targeted query types: a classified single-specialist
+# query does not need a supervisor round-trip to pick the obvious agent
+_QUERY_TYPE_ROUTES = {
+    QueryType.DOMAIN: "domain_expert",
+    QueryType.UX_UI: "ux_ui_specialist",
+    QueryType.TECHNICAL: "technical_architect",
+    QueryType.REVENUE: "revenue_model_analyst",
+}
+
+# Below this classification confidence a targeted route is too risky: a
+# mis-typed query would run the wrong specialist and need another LLM
+# round-trip to recover, so the query fans out to all specialists instead
+_CLASSIFY_CONFIDENCE_THRESHOLD = 0.85
+
+
+def classify_router(state: OverallState) -> str:
+    """Route classified queries to the cheapest path that covers them.
+
+    General queries need all specialist perspectives, so they are dispatched
+    concurrently instead of one-by-one through the supervisor. Confidently
+    targeted queries go straight to their specialist; ambiguous ones fan out
+    speculatively so the right analysis exists whichever type was correct.
+    Debate queries still go to the supervisor for routing.
+    """
+    if state.get("debate_category"):
+        return "supervisor"
+    query_type = state.get("query_type")
+    if query_type == QueryType.GENERAL:
+        return "parallel_specialists"
+    confidence = state.get("classification_confidence")
+    if confidence is not None and confidence < _CLASSIFY_CONFIDENCE_THRESHOLD:
+        return "parallel_specialists"
+    return _QUERY_TYPE_ROUTES.get(query_type, "supervisor")
+
+
+def specialist_router(state: OverallState) -> str:
+    """Skip aggregation when a single targeted specialist has run.
+
+    Running moderator_aggregation over one analysis is a redundant LLM
+    round-trip, so targeted queries go straight to the final answer (which
+    falls back to the lone specialist analysis). Everything else returns to
+    the supervisor for the next decision.
+    """
+    if state.get("debate_category") is None and state.get("query_type") in _QUERY_TYPE_ROUTES:
+        completed = sum(
+            1 for key in (
+                "domain_expert_analysis",
+                "ux_ui_specialist_analysis",
+                "technical_architect_analysis",
+                "revenue_model_analyst_analysis",
+            ) if state.get(key)
+        )
+        if completed == 1:
+            return "finalize_answer"
+    return "supervisor"
+
+
+def specialists_router(state: OverallState) -> str:
+    """Send completed parallel fan-outs straight to aggregation.
+
+    When parallel processing is disabled the fan-out node is a no-op, so
+    control falls back to the supervisor for sequential routing.
+    """
+    if any(
+        state.get(key)
+        for key in (
+            "domain_expert_analysis",
+            "ux_ui_specialist_analysis",
+            "technical_architect_analysis",
+            "revenue_model_analyst_analysis",
+        )
+    ):
+        return "moderator_aggregation"
+    return "supervisor"
+
+
 # Add conditional edges for Supervisor-based routing
 builder.add_conditional_edges(
     "classify_query",
-    lambda state: "supervisor",  # Always go to supervisor after classification
-    ["supervisor"]
+    classify_router,
+    ["parallel_specialists", "domain_expert", "ux_ui_specialist",
+     "technical_architect", "revenue_model_analyst", "supervisor"]
 )
 
 # Add conditional edges from supervisor to all possible agents
 builder.add_conditional_edges(
     "supervisor",
     supervisor_router,
-    ["domain_expert", "ux_ui_specialist", "technical_architect", "revenue_model_analyst", 
-     "moderator_aggregation", "analyze_debate", "finalize_answer"]
+    ["domain_expert", "ux_ui_specialist", "technical_architect", "revenue_model_analyst",
+     "moderator_aggregation", "finalize_answer"]
 )
 
-# All specialist agents return to supervisor for next decision
-builder.add_edge("domain_expert", "supervisor")
-builder.add_edge("ux_ui_specialist", "supervisor")
-builder.add_edge("technical_architect", "supervisor")
-builder.add_edge("revenue_model_analyst", "supervisor")
+# Specialist agents return to the supervisor for the next decision, except
+# when a lone targeted analysis can finalize directly
+for _specialist in ("domain_expert", "ux_ui_specialist", "technical_architect", "revenue_model_analyst"):
+    builder.add_conditional_edges(
+        _specialist,
+        specialist_router,
+        ["finalize_answer", "supervisor"]
+    )
 builder.add_edge("moderator_aggregation", "supervisor")
-builder.add_edge("analyze_debate", "supervisor")
+
+# The fan-out already holds every specialist analysis, so it can go straight
+# to aggregation without a supervisor hop (unless it was disabled and ran as
+# a no-op, in which case the supervisor takes over)
+builder.add_conditional_edges(
+    "parallel_specialists",
+    specialists_router,
+    ["moderator_aggregation", "supervisor"]
+)
 
 # Finalize answer leads to end
 builder.add_edge("finalize_answer", END)
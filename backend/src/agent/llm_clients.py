@@ -0,0 +1,226 @@
+"""Shared LLM client pool for the agent graph.
+
+Constructing a fresh ChatGoogleGenerativeAI inside every node invocation
+re-creates the underlying transport on each LLM call, paying TCP + TLS
+handshakes per agent per request. The chat clients are stateless for a given
+(model, temperature) pair, so a single shared instance per pair keeps the
+provider connections warm and multiplexed across all nodes and requests.
+"""
+
+import asyncio
+import hashlib
+import os
+from functools import lru_cache
+from typing import Any, List, Optional
+
+from cachetools import TTLCache
+from dotenv import load_dotenv
+from google.genai import Client
+from langchain_google_genai import ChatGoogleGenerativeAI
+
+load_dotenv()
+
+# Read once at import: every client construction needs the key, and rotating
+# it requires a process restart anyway. Kept None-tolerant so importing
+# without a key still works; get_genai_client raises when it is actually used.
+GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
+
+# Single shared google-genai client: one lazily created instance (and its
+# underlying HTTP connection pool) serves all callers instead of each module
+# holding its own. langchain-google-genai does not accept an injected httpx
+# transport, so connection reuse comes from sharing the client objects.
+_genai_client = None
+
+
+def get_genai_client() -> Client:
+    """Get or create the shared genai client instance."""
+    global _genai_client
+    if _genai_client is None:
+        if GEMINI_API_KEY is None:
+            raise ValueError("GEMINI_API_KEY is not set")
+        _genai_client = Client(api_key=GEMINI_API_KEY)
+    return _genai_client
+
+# Global bound on concurrent outbound LLM calls. N concurrent requests each
+# fan out several agent calls; without a bound the event loop floods the
+# provider with 5N simultaneous requests that compete for sockets and rate
+# limits, spiking tail latency. The semaphore makes queuing explicit and fair.
+LLM_MAX_CONCURRENCY = int(os.getenv("LLM_MAX_CONCURRENCY", "64"))
+_LLM_SEMAPHORE = asyncio.Semaphore(LLM_MAX_CONCURRENCY)
+
+
+async def bounded_ainvoke(llm: Any, llm_input: Any) -> Any:
+    """Invoke an LLM while holding the global concurrency semaphore.
+
+    Args:
+        llm: Any runnable exposing ainvoke (chat client or structured wrapper)
+        llm_input: Prompt string or message list to pass through
+
+    Returns:
+        The LLM response
+    """
+    async with _LLM_SEMAPHORE:
+        return await llm.ainvoke(llm_input)
+
+
+# Exact-match response cache: identical prompts against the same
+# (model, temperature, schema) produce the same structured result, so repeats
+# are answered from memory in microseconds instead of re-invoking Gemini.
+# Entries expire so cached analyses don't go stale indefinitely.
+LLM_CACHE_TTL_SECONDS = int(os.getenv("LLM_CACHE_TTL_SECONDS", "3600"))
+_LLM_RESPONSE_CACHE: TTLCache = TTLCache(maxsize=2048, ttl=LLM_CACHE_TTL_SECONDS)
+
+
+def _response_cache_key(model: str, temperature: float, schema: Optional[type], llm_input: Any) -> str:
+    """Build the exact-match cache key for an LLM invocation."""
+    if isinstance(llm_input, str):
+        prompt = llm_input
+    else:
+        # Message lists: concatenate contents in order
+        prompt = "\x00".join(str(getattr(message, "content", message)) for message in llm_input)
+    schema_name = schema.__name__ if schema is not None else "text"
+    return hashlib.sha256(f"{model}|{temperature}|{schema_name}|{prompt}".encode()).hexdigest()
+
+
+# In-flight invocations by cache key: concurrent identical prompts (e.g. the
+# parallel fan-out fed duplicate queries) race the response cache, so all but
+# the first coalesce onto the owner's pending future instead of each paying
+# an upstream call. Keys include the full prompt, so no per-request scoping
+# is needed.
+_INFLIGHT_CALLS: dict = {}
+
+
+async def _single_flight(key: str, generate) -> Any:
+    """Run generate() once per cache key, sharing the result with duplicates.
+
+    The owner stores the result in the response cache; concurrent callers
+    with the same key await the owner's future.
+
+    Args:
+        key: Exact-match cache key for the invocation
+        generate: Zero-argument coroutine function performing the LLM call
+
+    Returns:
+        The generated (or coalesced) result
+    """
+    existing = _INFLIGHT_CALLS.get(key)
+    if existing is not None:
+        return await existing
+    future = asyncio.get_running_loop().create_future()
+    _INFLIGHT_CALLS[key] = future
+    try:
+        result = await generate()
+        _LLM_RESPONSE_CACHE[key] = result
+        future.set_result(result)
+        return result
+    except asyncio.CancelledError:
+        # The owner being cancelled (per-node timeout, client disconnect)
+        # must not cancel coalesced waiters in other requests; hand them a
+        # TimeoutError their own degraded-result handling already covers
+        if not future.done():
+            future.set_exception(TimeoutError("Coalesced LLM call was cancelled"))
+            future.exception()
+        raise
+    except BaseException as exc:
+        future.set_exception(exc)
+        # Mark retrieved in case no duplicate caller ever awaits it
+        future.exception()
+        raise
+    finally:
+        _INFLIGHT_CALLS.pop(key, None)
+
+
+async def cached_ainvoke(llm: Any, llm_input: Any, model: str, temperature: float,
+                         schema: Optional[type] = None) -> Any:
+    """Invoke an LLM with an exact-match response cache in front of it.
+
+    Concurrent identical invocations are deduplicated: only one upstream
+    call runs and every caller shares its result.
+
+    Args:
+        llm: Any runnable exposing ainvoke (chat client or structured wrapper)
+        llm_input: Prompt string or message list to pass through
+        model: The Gemini model name (part of the cache key)
+        temperature: Sampling temperature (part of the cache key)
+        schema: Structured output schema class, or None for plain text
+
+    Returns:
+        The cached or freshly generated LLM response
+    """
+    key = _response_cache_key(model, temperature, schema, llm_input)
+    cached = _LLM_RESPONSE_CACHE.get(key)
+    if cached is not None:
+        return cached
+    return await _single_flight(key, lambda: bounded_ainvoke(llm, llm_input))
+
+
+async def cached_astream_text(llm: Any, llm_input: Any, model: str, temperature: float) -> str:
+    """Stream a plain-text completion and return the accumulated content.
+
+    Token chunks propagate through astream_events while the model generates,
+    so the caller's SSE layer can forward them as they arrive; the final text
+    is stored in the exact-match cache just like cached_ainvoke. On a cache
+    hit the text is returned immediately without streaming.
+
+    Args:
+        llm: Chat client exposing astream
+        llm_input: Prompt string or message list to pass through
+        model: The Gemini model name (part of the cache key)
+        temperature: Sampling temperature (part of the cache key)
+
+    Returns:
+        The full generated text
+    """
+    key = _response_cache_key(model, temperature, None, llm_input)
+    cached = _LLM_RESPONSE_CACHE.get(key)
+    if cached is not None:
+        return cached
+
+    async def _generate() -> str:
+        parts: List[str] = []
+        async with _LLM_SEMAPHORE:
+            async for chunk in llm.astream(llm_input):
+                if chunk.content:
+                    parts.append(chunk.content)
+        return "".join(parts)
+
+    # Duplicates coalesce onto the owner's stream and receive the full text
+    return await _single_flight(key, _generate)
+
+
+@lru_cache(maxsize=None)
+def get_llm(model: str, temperature: float) -> ChatGoogleGenerativeAI:
+    """Get or create the shared chat client for a (model, temperature) pair.
+
+    Args:
+        model: The Gemini model name
+        temperature: Sampling temperature for the client
+
+    Returns:
+        A cached ChatGoogleGenerativeAI instance shared across all callers
+    """
+    return ChatGoogleGenerativeAI(
+        model=model,
+        temperature=temperature,
+        max_retries=2,
+        api_key=GEMINI_API_KEY,
+    )
+
+
+@lru_cache(maxsize=None)
+def get_structured_llm(model: str, temperature: float, schema: type) -> Any:
+    """Get or create the shared structured-output wrapper for a schema.
+
+    with_structured_output rebuilds the Pydantic-to-tool JSON-schema binding
+    on every call, so the wrappers are cached alongside the clients instead
+    of being recreated per node invocation.
+
+    Args:
+        model: The Gemini model name
+        temperature: Sampling temperature for the client
+        schema: Pydantic model class describing the structured output
+
+    Returns:
+        A cached structured-output runnable shared across all callers
+    """
+    return get_llm(model, temperature).with_structured_output(schema)
@@ -0,0 +1,172 @@
+import logging
+import threading
+from typing import Any, List, Optional
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# The semantic cache needs an embedding model (and optionally FAISS for the
+# vector index). Both are optional dependencies; without them the cache
+# silently degrades to a no-op so the rest of the system is unaffected.
+try:
+    from sentence_transformers import SentenceTransformer
+    _EMBEDDINGS_AVAILABLE = True
+except ImportError:
+    SentenceTransformer = None
+    _EMBEDDINGS_AVAILABLE = False
+
+try:
+    import faiss
+    _FAISS_AVAILABLE = True
+except ImportError:
+    faiss = None
+    _FAISS_AVAILABLE = False
+
+import numpy as np
+
+
+class SemanticResponseCache:
+    """
+    Embedding-similarity cache for near-duplicate queries.
+
+    Exact-match caching misses paraphrases ("Design a checkout flow" vs
+    "Build a checkout UX"), which are common in product-requirement
+    refinement. This cache embeds each query once, searches prior queries by
+    cosine similarity, and returns the stored value when the best match
+    clears the similarity threshold.
+    """
+
+    def __init__(
+        self,
+        similarity_threshold: float = 0.93,
+        maxsize: int = 1024,
+        model_name: str = "sentence-transformers/all-MiniLM-L6-v2",
+        embedding_dim: int = 384,
+    ):
+        """
+        Initialize the semantic cache.
+
+        Args:
+            similarity_threshold: Minimum cosine similarity for a cache hit
+            maxsize: Maximum number of cached entries (FIFO eviction)
+            model_name: Sentence-transformers model used for embeddings
+            embedding_dim: Dimensionality of the embedding model output
+        """
+        self.similarity_threshold = similarity_threshold
+        self.maxsize = maxsize
+        self.model_name = model_name
+        self.embedding_dim = embedding_dim
+
+        self._model = None
+        self._lock = threading.Lock()
+        self._values: List[Any] = []
+
+        if _FAISS_AVAILABLE:
+            self._index = faiss.IndexFlatIP(embedding_dim)
+            self._vectors = None
+        else:
+            self._index = None
+            self._vectors = np.empty((0, embedding_dim), dtype=np.float32)
+
+    @property
+    def available(self) -> bool:
+        """Whether the embedding model dependency is installed."""
+        return _EMBEDDINGS_AVAILABLE
+
+    def _embed(self, text: str) -> Optional[np.ndarray]:
+        """Embed text as a single L2-normalized float32 vector."""
+        if not _EMBEDDINGS_AVAILABLE:
+            return None
+        if self._model is None:
+            with self._lock:
+                if self._model is None:
+                    logger.info(f"Loading semantic cache embedding model: {self.model_name}")
+                    self._model = SentenceTransformer(self.model_name)
+        vector = self._model.encode(text, normalize_embeddings=True)
+        return np.asarray(vector, dtype=np.float32).reshape(1, -1)
+
+    def get(self, text: str) -> Optional[Any]:
+        """
+        Look up the cached value for the closest prior query.
+
+        Args:
+            text: Query text to search for
+
+        Returns:
+            The cached value if the best match clears the similarity
+            threshold, otherwise None
+        """
+        if not self._values:
+            return None
+
+        vector = self._embed(text)
+        if vector is None:
+            return None
+
+        # Vectors are normalized, so inner product equals cosine similarity
+        if self._index is not None:
+            scores, indices = self._index.search(vector, 1)
+            score, idx = float(scores[0][0]), int(indices[0][0])
+        else:
+            scores = self._vectors @ vector[0]
+            idx = int(np.argmax(scores))
+            score = float(scores[idx])
+
+        if idx >= 0 and score >= self.similarity_threshold:
+            logger.info(f"Semantic cache hit (similarity={score:.3f})")
+            return self._values[idx]
+        return None
+
+    def add(self, text: str, value: Any) -> bool:
+        """
+        Store a value under the embedding of the given query text.
+
+        Args:
+            text: Query text to index
+            value: Value to cache
+
+        Returns:
+            bool: True if the entry was stored, False otherwise
+        """
+        vector = self._embed(text)
+        if vector is None:
+            return False
+
+        with self._lock:
+            if len(self._values) >= self.maxsize:
+                # Rebuilding the index on eviction is expensive; reset instead.
+                # The cache refills quickly under steady traffic.
+                logger.info("Semantic cache full; resetting index")
+                self._values = []
+                if self._index is not None:
+                    self._index.reset()
+                else:
+                    self._vectors = np.empty((0, self.embedding_dim), dtype=np.float32)
+
+            if self._index is not None:
+                self._index.add(vector)
+            else:
+                self._vectors = np.vstack([self._vectors, vector])
+            self._values.append(value)
+        return True
+
+
+def create_semantic_cache(
+    similarity_threshold: float = 0.93, maxsize: int = 1024
+) -> Optional[SemanticResponseCache]:
+    """
+    Factory function to create a semantic response cache.
+
+    Args:
+        similarity_threshold: Minimum cosine similarity for a cache hit
+        maxsize: Maximum number of cached entries
+
+    Returns:
+        SemanticResponseCache instance, or None when the optional embedding
+        dependencies are not installed
+    """
+    if not _EMBEDDINGS_AVAILABLE:
+        logger.info("sentence-transformers not installed; semantic cache disabled")
+        return None
+    return SemanticResponseCache(similarity_threshold=similarity_threshold, maxsize=maxsize)
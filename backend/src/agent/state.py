@@ -2,14 +2,14 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from typing import TypedDict, List, Optional, Dict, Any
-from enum import Enum
+from enum import StrEnum
 
 from langgraph.graph import add_messages
 from typing_extensions import Annotated
 import operator
 
 
-class QueryType(Enum):
+class QueryType(StrEnum):
     DOMAIN = "domain"
     UX_UI = "ux_ui"
     TECHNICAL = "technical"
@@ -17,7 +17,7 @@ class QueryType(Enum):
     GENERAL = "general"
 
 
-class DebateCategory(Enum):
+class DebateCategory(StrEnum):
     DOMAIN_EXPERT = "domain_expert"
     UX_UI_SPECIALIST = "ux_ui_specialist"
     TECHNICAL_ARCHITECT = "technical_architect"
@@ -25,7 +25,7 @@ class DebateCategory(Enum):
     MODERATOR = "moderator"
 
 
-class AgentType(Enum):
+class AgentType(StrEnum):
     SUPERVISOR = "supervisor"
     DOMAIN_EXPERT = "domain_expert"
     UX_UI_SPECIALIST = "ux_ui_specialist"
@@ -34,7 +34,7 @@ class AgentType(Enum):
     MODERATOR = "moderator"
 
 
-class SupervisorDecision(Enum):
+class SupervisorDecision(StrEnum):
     CONTINUE = "continue"
     END = "end"
     DEBATE = "debate"
@@ -44,15 +44,22 @@ class OverallState(TypedDict):
     messages: Annotated[list, add_messages]
     user_query: str
     query_type: QueryType
+    # Classifier confidence for query_type (low scores widen the routing)
+    classification_confidence: Optional[float]
     debate_category: Optional[DebateCategory]
-    domain_expert_analysis: Optional[str]
-    ux_ui_specialist_analysis: Optional[str]
-    technical_architect_analysis: Optional[str]
-    revenue_model_analyst_analysis: Optional[str]
+    # Specialist results are stored structured (model_dump dicts) and only
+    # rendered to markdown at the edges; timed-out runs leave a placeholder
+    # string instead
+    domain_expert_analysis: Optional[Dict[str, Any] | str]
+    ux_ui_specialist_analysis: Optional[Dict[str, Any] | str]
+    technical_architect_analysis: Optional[Dict[str, Any] | str]
+    revenue_model_analyst_analysis: Optional[Dict[str, Any] | str]
     moderator_aggregation: Optional[str]
     debate_resolution: Optional[str]
     final_answer: Optional[str]
     processing_time: float
+    # Precomputed domain analysis fragment (Cache Augmented Generation)
+    cag_prefix: Optional[str]
     # Supervisor-related fields
     active_agent: Optional[AgentType]
     supervisor_decision: Optional[SupervisorDecision]
@@ -114,10 +121,10 @@ class SupervisorState(TypedDict):
     current_step: int
     max_steps: int
     agent_history: List[Dict[str, Any]]
-    domain_expert_analysis: Optional[str]
-    ux_ui_specialist_analysis: Optional[str]
-    technical_architect_analysis: Optional[str]
-    revenue_model_analyst_analysis: Optional[str]
+    domain_expert_analysis: Optional[Dict[str, Any] | str]
+    ux_ui_specialist_analysis: Optional[Dict[str, Any] | str]
+    technical_architect_analysis: Optional[Dict[str, Any] | str]
+    revenue_model_analyst_analysis: Optional[Dict[str, Any] | str]
     moderator_aggregation: Optional[str]
     debate_resolution: Optional[str]
     final_answer: Optional[str]
@@ -1,11 +1,11 @@
 from typing import List, Optional
-from pydantic import BaseModel, Field
-from enum import Enum
+from pydantic import BaseModel, ConfigDict, Field
+from enum import StrEnum
 
 from src.agent.state import AgentType, SupervisorDecision
 
 
-class QueryType(Enum):
+class QueryType(StrEnum):
     DOMAIN = "domain"
     UX_UI = "ux_ui"
     TECHNICAL = "technical"
@@ -13,7 +13,7 @@ class QueryType(Enum):
     GENERAL = "general"
 
 
-class DebateCategory(Enum):
+class DebateCategory(StrEnum):
     DOMAIN_EXPERT = "domain_expert"
     UX_UI_SPECIALIST = "ux_ui_specialist"
     TECHNICAL_ARCHITECT = "technical_architect"
@@ -21,7 +21,12 @@ class DebateCategory(Enum):
     MODERATOR = "moderator"
 
 
+# All schemas are read-only DTOs parsed from structured LLM output:
+# frozen skips per-field assignment machinery and extra="ignore" drops
+# unexpected keys instead of raising mid-request.
 class SupervisorAnalysis(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     next_agent: AgentType = Field(
         description="The next agent that should be called to continue the analysis."
     )
@@ -40,6 +45,8 @@ class SupervisorAnalysis(BaseModel):
 
 
 class DomainExpertAnalysis(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     domain_analysis: str = Field(
         description="Detailed analysis of the domain-specific aspects of the product requirements."
     )
@@ -55,6 +62,8 @@ class DomainExpertAnalysis(BaseModel):
 
 
 class UXUISpecialistAnalysis(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     ux_analysis: str = Field(
         description="Detailed analysis of user experience aspects of the product requirements."
     )
@@ -70,6 +79,8 @@ class UXUISpecialistAnalysis(BaseModel):
 
 
 class TechnicalArchitectAnalysis(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     technical_analysis: str = Field(
         description="Detailed analysis of technical architecture aspects of the product requirements."
     )
@@ -85,6 +96,8 @@ class TechnicalArchitectAnalysis(BaseModel):
 
 
 class RevenueModelAnalystAnalysis(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     revenue_analysis: str = Field(
         description="Detailed analysis of revenue model and monetization aspects of the product requirements."
     )
@@ -103,6 +116,8 @@ class RevenueModelAnalystAnalysis(BaseModel):
 
 
 class ModeratorAggregation(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     aggregated_requirements: List[str] = Field(
         description="Consolidated list of all requirements from different specialists."
     )
@@ -119,6 +134,8 @@ class ModeratorAggregation(BaseModel):
 
 
 class DebateAnalysis(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     debate_category: DebateCategory = Field(
         description="Category of the debate to determine which specialist should handle it."
     )
@@ -134,6 +151,8 @@ class DebateAnalysis(BaseModel):
 
 
 class QueryClassification(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     query_type: QueryType = Field(
         description="Classification of the user query to determine routing."
     )
@@ -143,3 +162,21 @@ class QueryClassification(BaseModel):
     reasoning: str = Field(
         description="Reasoning behind the classification decision."
     )
+    # Debate fields fused from DebateAnalysis so a single classification call
+    # also covers debate detection and routing (populated when is_debate).
+    is_debate: bool = Field(
+        description="Whether the query contains a debate, conflict, or disagreement to resolve.",
+        default=False
+    )
+    debate_category: Optional[DebateCategory] = Field(
+        description="Category of the debate to determine which specialist should handle it (only when is_debate).",
+        default=None
+    )
+    routing_decision: Optional[str] = Field(
+        description="Decision on how to route the debate for resolution (only when is_debate).",
+        default=None
+    )
+    urgency_level: Optional[str] = Field(
+        description="Urgency level of the debate (High/Medium/Low, only when is_debate).",
+        default=None
+    )
@@ -33,7 +33,7 @@ def test_full_graph_build():
         from src.agent.graph import (
             supervisor_node, classify_query, domain_expert_analysis,
             ux_ui_specialist_analysis, technical_architect_analysis,
-            revenue_model_analyst_analysis, analyze_debate,
+            revenue_model_analyst_analysis,
             moderator_aggregation, finalize_answer, supervisor_router
         )
         print("✅ All nodes imported")
@@ -57,9 +57,6 @@ def test_full_graph_build():
         builder.add_node("revenue_model_analyst", revenue_model_analyst_analysis)
         print("✅ Revenue model analyst node added")
         
-        builder.add_node("analyze_debate", analyze_debate)
-        print("✅ Analyze debate node added")
-        
         builder.add_node("moderator_aggregation", moderator_aggregation)
         print("✅ Moderator aggregation node added")
         
@@ -80,8 +77,8 @@ def test_full_graph_build():
         builder.add_conditional_edges(
             "supervisor",
             supervisor_router,
-            ["domain_expert", "ux_ui_specialist", "technical_architect", "revenue_model_analyst", 
-             "moderator_aggregation", "analyze_debate", "finalize_answer"]
+            ["domain_expert", "ux_ui_specialist", "technical_architect", "revenue_model_analyst",
+             "moderator_aggregation", "finalize_answer"]
         )
         print("✅ Supervisor edges added")
         
@@ -90,7 +87,6 @@ def test_full_graph_build():
         builder.add_edge("technical_architect", "supervisor")
         builder.add_edge("revenue_model_analyst", "supervisor")
         builder.add_edge("moderator_aggregation", "supervisor")
-        builder.add_edge("analyze_debate", "supervisor")
         print("✅ Agent return edges added")
         
         builder.add_edge("finalize_answer", END)
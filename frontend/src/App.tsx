@@ -24,6 +24,7 @@ interface Message {
 interface StreamEvent {
   type: string;
   content: string;
+  delta?: string;
 }
 
 export default function App() {
@@ -431,9 +432,24 @@ export default function App() {
         setCurrentStreamingMessage((prev: string) => prev + "\n\n**Moderator Aggregation:**\n" + event.content);
         break;
       
+      case 'final_answer_delta':
+        // Individual tokens streamed while the final answer is generating
+        setStreamingMetadata((prev: any) => ({ ...prev, final_answer: (prev.final_answer || "") + event.delta }));
+        setCurrentStreamingMessage((prev: string) =>
+          prev.includes("\n\n**Final Answer:**\n")
+            ? prev + event.delta
+            : prev + "\n\n**Final Answer:**\n" + event.delta);
+        break;
+
       case 'final_answer':
         setStreamingMetadata((prev: any) => ({ ...prev, final_answer: event.content }));
-        setCurrentStreamingMessage((prev: string) => prev + "\n\n**Final Answer:**\n" + event.content);
+        // The completion event carries the authoritative full text; replace
+        // any partially streamed answer instead of appending it twice
+        setCurrentStreamingMessage((prev: string) => {
+          const markerIndex = prev.indexOf("\n\n**Final Answer:**\n");
+          const base = markerIndex >= 0 ? prev.slice(0, markerIndex) : prev;
+          return base + "\n\n**Final Answer:**\n" + event.content;
+        });
         break;
       
       case 'message':